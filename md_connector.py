@@ -22,24 +22,48 @@ Outputs:
 import os
 import re
 import sys
+import json
 import argparse
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING, Iterator
 from pathlib import Path
 from datetime import datetime, timezone
 
-try:
+# rich is imported on first use (see _load_rich) so that callers which only
+# need the scanner, like md_connector_outputs.py, do not pay its import cost.
+if TYPE_CHECKING:
     from rich.console import Console
     from rich.table import Table
     from rich.panel import Panel
     from rich import box
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+else:
+    Console = Table = Panel = box = None   # bound by _load_rich()
+
+RICH_AVAILABLE = importlib.util.find_spec("rich") is not None
+_rich_loaded = False
+
+
+def _load_rich() -> bool:
+    """Import rich once, binding Console/Table/Panel/box; return availability."""
+    global RICH_AVAILABLE, _rich_loaded, Console, Table, Panel, box
+    if RICH_AVAILABLE and not _rich_loaded:
+        try:
+            from rich.console import Console
+            from rich.table import Table
+            from rich.panel import Panel
+            from rich import box
+        except ImportError:
+            RICH_AVAILABLE = False
+        _rich_loaded = True
+    return RICH_AVAILABLE
 
 
 # ── Data model ─────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class MDFile:
     path: Path
     title: str           = ""
@@ -47,23 +71,33 @@ class MDFile:
     word_count: int      = 0
     sections: list[str]  = field(default_factory=list)   # H2 headings
     is_readme: bool      = False
+    resolved: str        = ""   # realpath, computed once during discovery
+    relpath: str         = ""   # path relative to the project root, for display
 
 
 # ── Content parsing ────────────────────────────────────────────────────────────
 
-_CODE_FENCE_RE = re.compile(r'^(`{3}|~{3})')
+_MAX_SECTIONS = 6   # H2 headings kept per file, to keep the report tidy
 _WORD_RE = re.compile(r'\w+')
-_HEADING_RE = re.compile(r'^(#{1,3})\s+(.+)', re.MULTILINE)
 _DOCS_RE = re.compile(r'\b(docs?|documentation)\b', re.IGNORECASE)
-
-
-def _is_code_fence(stripped: str) -> bool:
-    return bool(_CODE_FENCE_RE.match(stripped))
-
-
-def _is_skippable_line(stripped: str) -> bool:
-    """Return True for badge images and raw HTML lines."""
-    return bool(re.match(r'^\[!\[', stripped) or re.match(r'^<', stripped))
+# "- [title](target)" list links as written by _build_link_lines; the target
+# may hold one level of balanced parentheses, e.g. "notes (draft).md"
+_LINK_ITEM_RE = re.compile(r'- \[[^\n]*?\]\((?:[^()\n]|\([^()\n]*\))*\)')
+# Heading of the section fix_generic creates and appends to
+OTHER_DOCS_HEADING = "## 📎 Other Documentation"
+# Bare paths may only start at a token boundary (never right after "("), so
+# each token is tried once and long runs of path characters stay linear.
+_BARE_PATH = r'(?<![^\s\'"`<>)\[\]])(?P<bare>[^\s\'"`<>()\[\]]+\.md)(?!\))'
+_BARE_RE = re.compile(_BARE_PATH, re.IGNORECASE)
+# Markdown links (link text may hold one level of nested brackets, e.g. a
+# badge image; the destination may be wrapped in <...>), HTML href
+# attributes, and bare paths — scanned in one pass.
+_REF_RE = re.compile(
+    r'\[(?P<text>(?:[^\[\]\n]|\[[^\]\n]*\])*)\]\(<?(?P<md>[^)>]+\.md[^)>]*)>?\)'
+    r'|href=["\'](?P<html>[^"\']+\.md[^"\']*)["\']'
+    r'|' + _BARE_PATH,
+    re.IGNORECASE,
+)
 
 
 def _looks_like_text(stripped: str) -> bool:
@@ -71,89 +105,99 @@ def _looks_like_text(stripped: str) -> bool:
     return (
         bool(stripped)
         and len(stripped) < 80
-        and not stripped.startswith("-")
-        and not stripped.startswith("*")
+        and not stripped.startswith(("-", "*"))
     )
 
 
-def _scan_structure(lines: list[str]) -> tuple[str, list[str]]:
-    """Return (h1_title, h2_sections) from markdown lines, skipping code blocks."""
+def _read_text(path: Path) -> str:
+    """
+    Read a file as UTF-8, dropping undecodable bytes, with one os.read
+    sized from fstat — far less per-file overhead than Path.read_text.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        while len(data) < size:   # short read: keep going until EOF
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        os.close(fd)
+    return data.decode("utf-8", errors="ignore")
+
+
+def _parse_all(content: str) -> tuple[str, str, int, list[str]]:
+    """
+    Return (h1_title, description, word_count, h2_sections) in one pass.
+
+    Fenced code blocks are skipped for structure and description; badge
+    and raw HTML lines are ignored when looking for the description.
+    """
     title = ""
     sections: list[str] = []
+    para: list[str] = []
     in_code = False
-    for line in lines:
+    past_heading = False
+    desc_done = False
+    for line in content.splitlines():
         stripped = line.strip()
-        if _is_code_fence(stripped):
+        # Dispatch on the first character so plain prose takes one branch
+        c = stripped[:1]
+        if (c == "`" or c == "~") and stripped.startswith(("```", "~~~")):
             in_code = not in_code
             continue
         if in_code:
             continue
-        if not title and stripped.startswith("# "):
-            title = stripped[2:].strip()
-        elif stripped.startswith("## "):
-            sections.append(stripped[3:].strip())
-    return title, sections
-
-
-def _strip_code_blocks(lines: list[str]) -> list[str]:
-    """Return lines with fenced code blocks and badge/HTML lines removed."""
-    result = []
-    in_code = False
-    for line in lines:
-        stripped = line.strip()
-        if _is_code_fence(stripped):
-            in_code = not in_code
-            continue
-        if not in_code and not _is_skippable_line(stripped):
-            result.append(stripped)
-    return result
-
-
-def _first_paragraph_after_heading(lines: list[str]) -> list[str]:
-    """Return the first paragraph of text that appears after a heading line."""
-    past_heading = False
-    para: list[str] = []
-    for line in lines:
-        if line.startswith("#"):
+        if c == "#":
+            if not title and stripped.startswith("# "):
+                title = stripped[2:].strip()
+            elif stripped.startswith("## "):
+                sections.append(stripped[3:].strip())
+            # A heading starts the description search, or ends the paragraph
             past_heading = True
-            if para:
-                break
+            desc_done = desc_done or bool(para)
+            if title and desc_done and len(sections) >= _MAX_SECTIONS:
+                break   # nothing more to collect; words are counted separately
             continue
-        if not past_heading:
-            if _looks_like_text(line):
-                past_heading = True
+        # Badge images and raw HTML lines never form part of the description
+        if desc_done or c == "<" or (c == "[" and stripped.startswith("[![")):
             continue
-        if line:
-            para.append(line)
+        # Description: first paragraph of text after the opening heading
+        if not past_heading:
+            past_heading = _looks_like_text(stripped)
+        elif stripped:
+            para.append(stripped)
         elif para:
-            break
-    return para
-
+            desc_done = True
 
-def _scan_description(lines: list[str]) -> str:
-    """Return the first real paragraph after the opening heading."""
-    clean = _strip_code_blocks(lines)
-    para = _first_paragraph_after_heading(clean)
-    result = " ".join(para)
-    return result[:157] + "..." if len(result) > 160 else result
+    description = " ".join(para)
+    if len(description) > 160:
+        description = description[:157] + "..."
+    # subn counts matches in C without building a list of every word
+    return title, description, _WORD_RE.subn("", content)[1], sections
 
 
-def parse_md_content(path: Path) -> dict:
+def parse_md_content(path: Path, cache: dict | None = None) -> dict:
     """
     Extract metadata from a Markdown file:
       - title     : first H1 line, or filename stem
       - description: first non-empty, non-heading paragraph (≤ 160 chars)
       - word_count : total words in file
       - sections   : list of H2 headings
+
+    If a cache dict is given (see load_parse_cache), results are reused
+    while the file's mtime and size are unchanged.
     """
+    if cache is not None:
+        return _parse_md_cached(path, cache)
     try:
-        content = path.read_text(encoding="utf-8", errors="ignore")
+        content = _read_text(path)
     except OSError:
         return {"title": path.stem, "description": "", "word_count": 0, "sections": []}
 
-    lines = content.splitlines()
-    title, sections = _scan_structure(lines)
-    description = _scan_description(lines)
+    title, description, word_count, sections = _parse_all(content)
 
     if not title:
         title = path.stem.replace("-", " ").replace("_", " ").title()
@@ -161,40 +205,137 @@ def parse_md_content(path: Path) -> dict:
     return {
         "title": title,
         "description": description,
-        "word_count": len(_WORD_RE.findall(content)),
-        "sections": sections[:6],   # cap at 6 to keep report tidy
+        "word_count": word_count,
+        "sections": sections[:_MAX_SECTIONS],
     }
 
 
+# ── Parse cache ────────────────────────────────────────────────────────────────
+
+CACHE_FILENAME = ".md_connector_cache.json"
+_CACHE_VERSION = 1
+_META_KEYS = frozenset({"title", "description", "word_count", "sections"})
+
+
+def _parse_md_cached(path: Path, cache: dict) -> dict:
+    """parse_md_content() memoized in cache on (path, mtime_ns, size)."""
+    try:
+        st = path.stat()
+    except OSError:
+        return parse_md_content(path)
+    key = str(path)
+    stamp = [st.st_mtime_ns, st.st_size]
+    entry = cache.get(key)
+    if isinstance(entry, dict) and entry.get("stamp") == stamp:
+        meta = entry.get("meta")
+        if isinstance(meta, dict) and meta.keys() >= _META_KEYS:
+            return meta
+    meta = parse_md_content(path)
+    cache[key] = {"stamp": stamp, "meta": meta}
+    return meta
+
+
+def load_parse_cache(cache_path: Path) -> dict:
+    """Load cached parse results; returns {} if missing, corrupt or outdated."""
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def save_parse_cache(cache_path: Path, cache: dict):
+    """Write parse results back to disk; failures are ignored."""
+    try:
+        cache_path.write_text(
+            json.dumps({"version": _CACHE_VERSION, "files": cache}),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass
+
+
 # ── File discovery ─────────────────────────────────────────────────────────────
 
-def find_all_md_files(
+def _walk_md(root: str, exclude_dirs: set[str]):
+    """
+    Yield os.DirEntry objects for every .md file under root.
+    Walks iteratively with an explicit stack, pruning excluded directory
+    names before descending; symlinked directories are not followed and
+    unreadable directories are skipped.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in exclude_dirs:
+                            stack.append(entry.path)
+                    elif entry.name.lower().endswith(".md"):
+                        yield entry
+        except (PermissionError, FileNotFoundError):
+            continue
+
+
+def find_all_md_paths(
     root: Path,
     exclude_dirs: list[str],
     exclude_files: set[Path] | None = None,
 ) -> list[MDFile]:
-    """Recursively find all .md files, parse content, return MDFile list."""
-    excluded = {p.resolve() for p in (exclude_files or [])}
+    """
+    Recursively find all .md files and return MDFile entries without
+    reading them.  Call hydrate() on the ones whose content is needed.
+    """
+    excluded = {os.path.realpath(p) for p in (exclude_files or [])}
+    entries = sorted(_walk_md(str(root), set(exclude_dirs)), key=lambda e: e.path)
+    prefix_len = len(os.path.join(str(root), ""))
     results = []
-    for path in sorted(root.rglob("*.md")):
-        parts = path.relative_to(root).parts
-        if any(part in exclude_dirs for part in parts):
-            continue
-        if path.resolve() in excluded:
+    for entry in entries:
+        resolved = os.path.realpath(entry.path)
+        if resolved in excluded:
             continue
-        meta = parse_md_content(path)
-        is_readme = path.stem.lower() == "readme"
+        path = Path(entry.path)
         results.append(MDFile(
             path=path,
-            title=meta["title"],
-            description=meta["description"],
-            word_count=meta["word_count"],
-            sections=meta["sections"],
-            is_readme=is_readme,
+            is_readme=path.stem.lower() == "readme",
+            resolved=resolved,
+            relpath=entry.path[prefix_len:],
         ))
     return results
 
 
+def hydrate(md: MDFile, cache: dict | None = None) -> MDFile:
+    """Populate title, description, word count and sections from file content."""
+    meta = parse_md_content(md.path, cache)
+    md.title = meta["title"]
+    md.description = meta["description"]
+    md.word_count = meta["word_count"]
+    md.sections = meta["sections"]
+    return md
+
+
+def hydrate_all(md_files: list[MDFile], cache: dict | None = None) -> list[MDFile]:
+    """Hydrate MDFile entries concurrently; file reads release the GIL."""
+    if md_files:
+        workers = min(32, (os.cpu_count() or 1) * 4, len(md_files))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            list(ex.map(partial(hydrate, cache=cache), md_files))
+    return md_files
+
+
+def find_all_md_files(
+    root: Path,
+    exclude_dirs: list[str],
+    exclude_files: set[Path] | None = None,
+) -> list[MDFile]:
+    """Recursively find all .md files, parse content, return MDFile list."""
+    return hydrate_all(find_all_md_paths(root, exclude_dirs, exclude_files))
+
+
 def find_all_readmes(md_files: list[MDFile]) -> list[Path]:
     """Return paths of all README files found, sorted root-first."""
     return sorted(
@@ -203,37 +344,68 @@ def find_all_readmes(md_files: list[MDFile]) -> list[Path]:
     )
 
 
+def find_root_readme(md_files: list[MDFile], root: Path) -> Path | None:
+    """Return the README directly inside root, or None — one linear pass."""
+    root_s = str(root)
+    for f in md_files:
+        if f.is_readme and os.path.dirname(f.path) == root_s:
+            return f.path
+    return None
+
+
 # ── Reference extraction ───────────────────────────────────────────────────────
 
-def extract_md_references(readme_path: Path, root: Path) -> set[Path]:
+def extract_md_references(
+    readme_path: Path,
+    root: Path,
+    known_paths: set[str] | None = None,
+) -> set[Path]:
     """
     Parse a README.md and extract all internal .md references.
     Handles markdown links, bare paths, and HTML href attributes.
+
+    known_paths is an optional set of realpath strings for files already
+    discovered; references without a ".." segment that normalise to one of
+    them are accepted without touching the filesystem.
     """
     try:
-        content = readme_path.read_text(encoding="utf-8", errors="ignore")
+        content = _read_text(readme_path)
     except OSError:
         return set()
 
-    link_pattern = re.compile(r'\[.*?\]\(([^)]+\.md[^)]*)\)', re.IGNORECASE)
-    bare_pattern = re.compile(r'(?<!\()([^\s\'"<>()\[\]]+\.md)(?!\))', re.IGNORECASE)
-    html_pattern = re.compile(r'href=["\']([^"\']+\.md[^"\']*)["\']', re.IGNORECASE)
-
     raw_refs = set()
-    for pat in (link_pattern, bare_pattern, html_pattern):
-        for match in pat.finditer(content):
-            ref = match.group(1).split("#")[0].strip()
-            raw_refs.add(ref)
-
+    for match in _REF_RE.finditer(content):
+        ref = match.group("md") or match.group("html") or match.group("bare")
+        raw_refs.add(ref.split("#")[0].strip())
+        text = match.group("text")
+        if text:   # link text may itself name a file, e.g. [docs/a.md](https://…)
+            raw_refs.update(m.group("bare") for m in _BARE_RE.finditer(text))
+
+    known = known_paths or set()
     resolved = set()
     readme_dir = readme_path.parent
+    bases = (readme_dir,) if readme_dir == root else (readme_dir, root)
     for ref in raw_refs:
         if ref.startswith("http://") or ref.startswith("https://"):
             continue
-        for base in (readme_dir, root):
-            candidate = (base / ref).resolve()
-            if candidate.exists():
-                resolved.add(candidate)
+        # normpath collapses ".." lexically, which is wrong after a symlinked
+        # directory, so those references always go to the filesystem, and are
+        # resolved before the existence check: "missing/../b.md" names b.md
+        lexical = ".." not in ref.replace("\\", "/").split("/")
+        for base in bases:
+            if not lexical:
+                candidate = (base / ref).resolve()
+                if candidate.exists():
+                    resolved.add(candidate)
+                    break
+                continue
+            joined = os.path.normpath(os.path.join(base, ref))
+            if joined in known:
+                resolved.add(Path(joined))
+                break
+            candidate = base / ref
+            if candidate.exists():   # only pay for resolve() on a hit
+                resolved.add(candidate.resolve())
                 break
 
     return resolved
@@ -258,17 +430,20 @@ def classify_files(
       isolated   - MDFile objects not referenced by the root README
       root_refs  - set of resolved paths referenced in the root README
     """
+    resolved_md = [(md, md.resolved or os.path.realpath(md.path)) for md in all_md]
     root_refs: set[Path] = (
-        extract_md_references(root_readme, root) if root_readme else set()
+        extract_md_references(root_readme, root, {r for _, r in resolved_md})
+        if root_readme else set()
     )
-    root_readme_resolved = root_readme.resolve() if root_readme else None
+    ref_strs = frozenset(str(p) for p in root_refs)
+    root_readme_resolved = os.path.realpath(root_readme) if root_readme else None
 
     linked, isolated = [], []
-    for md in all_md:
+    for md, resolved in resolved_md:
         # Skip the root README itself — it is the reference document
-        if root_readme_resolved and md.path.resolve() == root_readme_resolved:
+        if root_readme_resolved and resolved == root_readme_resolved:
             continue
-        if md.path.resolve() in root_refs:
+        if resolved in ref_strs:
             linked.append(md)
         else:
             isolated.append(md)
@@ -278,6 +453,11 @@ def classify_files(
 
 # ── Terminal dashboard ─────────────────────────────────────────────────────────
 
+def _display_path(md: MDFile, root: Path) -> str:
+    """md.relpath as set by discovery, else the path relative to root."""
+    return md.relpath or str(md.path.relative_to(root))
+
+
 def _make_summary_table(
     root: Path,
     root_readme: Path | None,
@@ -287,6 +467,7 @@ def _make_summary_table(
 ) -> "Table":
     readme_display = str(root_readme.relative_to(root)) if root_readme else "[red]NOT FOUND[/red]"
     coverage = (len(linked) / total * 100) if total > 0 else 0
+    _load_rich()
     t = Table(box=box.SIMPLE, show_header=False, padding=(0, 2))
     t.add_column(style="bold")
     t.add_column()
@@ -302,6 +483,7 @@ def _make_summary_table(
 
 
 def _make_linked_table(root: Path, linked: list[MDFile]) -> "Table":
+    _load_rich()
     t = Table(box=box.SIMPLE_HEAD, show_header=True)
     t.add_column("#", style="dim", width=4)
     t.add_column("File", style="green", min_width=28)
@@ -312,7 +494,7 @@ def _make_linked_table(root: Path, linked: list[MDFile]) -> "Table":
         sections_str = ", ".join(md.sections[:3]) + ("…" if len(md.sections) > 3 else "")
         t.add_row(
             str(i),
-            str(md.path.relative_to(root)),
+            _display_path(md, root),
             md.title[:35] + ("…" if len(md.title) > 35 else ""),
             str(md.word_count),
             sections_str or "—",
@@ -321,6 +503,7 @@ def _make_linked_table(root: Path, linked: list[MDFile]) -> "Table":
 
 
 def _make_isolated_table(root: Path, isolated: list[MDFile]) -> "Table":
+    _load_rich()
     t = Table(box=box.SIMPLE_HEAD, show_header=True)
     t.add_column("#", style="dim", width=4)
     t.add_column("File", style="yellow", min_width=28)
@@ -331,7 +514,7 @@ def _make_isolated_table(root: Path, isolated: list[MDFile]) -> "Table":
         desc = md.description[:55] + ("…" if len(md.description) > 55 else "") or "—"
         t.add_row(
             str(i),
-            str(md.path.relative_to(root)),
+            _display_path(md, root),
             md.title[:35] + ("…" if len(md.title) > 35 else ""),
             str(md.word_count),
             desc,
@@ -346,6 +529,7 @@ def print_dashboard_rich(
     linked: list[MDFile],
     isolated: list[MDFile],
 ):
+    _load_rich()
     console = Console()
     total = len(all_md) - (1 if root_readme else 0)
 
@@ -392,12 +576,12 @@ def print_dashboard_plain(
     if linked:
         print("\n-- Linked Files --")
         for md in linked:
-            print(f"  [OK] {md.path.relative_to(root)}  |  {md.title}  |  {md.word_count} words")
+            print(f"  [OK] {_display_path(md, root)}  |  {md.title}  |  {md.word_count} words")
 
     if isolated:
         print("\n-- Isolated Files --")
         for md in isolated:
-            print(f"  [!!] {md.path.relative_to(root)}  |  {md.title}  |  {md.word_count} words")
+            print(f"  [!!] {_display_path(md, root)}  |  {md.title}  |  {md.word_count} words")
             if md.description:
                 print(f"       {md.description[:100]}")
     print()
@@ -405,63 +589,52 @@ def print_dashboard_plain(
 
 # ── Markdown report ────────────────────────────────────────────────────────────
 
-def _md_linked_section(root: Path, linked: list[MDFile]) -> list[str]:
-    """Return markdown table lines for the linked-files section."""
-    rows = [
-        "## ✅ Linked Files\n",
-        "| # | File | Title | Words | Sections |",
-        "|---|------|-------|-------|----------|",
-    ]
+def _md_linked_section(root: Path, linked: list[MDFile]) -> Iterator[str]:
+    """Yield markdown table lines for the linked-files section."""
+    yield "## ✅ Linked Files\n"
+    yield "| # | File | Title | Words | Sections |"
+    yield "|---|------|-------|-------|----------|"
     for i, md in enumerate(linked, 1):
         sections = ", ".join(md.sections[:4]) or "—"
-        rows.append(
-            f"| {i} | `{md.path.relative_to(root)}` | {md.title} | {md.word_count} | {sections} |"
-        )
-    rows.append("")
-    return rows
+        yield f"| {i} | `{_display_path(md, root)}` | {md.title} | {md.word_count} | {sections} |"
+    yield ""
 
 
-def _md_isolated_section(root: Path, isolated: list[MDFile]) -> list[str]:
-    """Return markdown lines for the isolated-files section including suggestions."""
-    rows = [
-        "## ⚠️ Isolated Files\n",
-        "> These files are **not referenced** by the root `README.md`.\n",
-        "| # | File | Title | Words | Description |",
-        "|---|------|-------|-------|-------------|",
-    ]
+def _md_isolated_section(root: Path, isolated: list[MDFile]) -> Iterator[str]:
+    """Yield markdown lines for the isolated-files section including suggestions."""
+    yield "## ⚠️ Isolated Files\n"
+    yield "> These files are **not referenced** by the root `README.md`.\n"
+    yield "| # | File | Title | Words | Description |"
+    yield "|---|------|-------|-------|-------------|"
     for i, md in enumerate(isolated, 1):
         desc = md.description.replace("|", "\\|") if md.description else "—"
-        rows.append(
-            f"| {i} | `{md.path.relative_to(root)}` | {md.title} | {md.word_count} | {desc} |"
-        )
-    rows += [
-        "",
-        "### 💡 Suggested additions\n",
-        "Add the following snippets to your root `README.md`:\n",
-        "```markdown",
-    ]
+        yield f"| {i} | `{_display_path(md, root)}` | {md.title} | {md.word_count} | {desc} |"
+    yield ""
+    yield "### 💡 Suggested additions\n"
+    yield "Add the following snippets to your root `README.md`:\n"
+    yield "```markdown"
     for md in isolated:
-        rows.append(f"- [{md.title}]({md.path.relative_to(root)})")
+        yield f"- [{md.title}]({_display_path(md, root)})"
         if md.description:
-            rows.append(f"  _{md.description}_")
-    rows += ["```", ""]
-    return rows
+            yield f"  _{md.description}_"
+    yield "```"
+    yield ""
 
 
-def generate_md_report(
+def _md_report_lines(
     root: Path,
     root_readme: Path | None,
     all_md: list[MDFile],
     linked: list[MDFile],
     isolated: list[MDFile],
-    output_path: Path,
-):
+) -> Iterator[str]:
+    """Yield every line of the markdown report, in order."""
     total = len(all_md) - (1 if root_readme else 0)
     coverage = (len(linked) / total * 100) if total > 0 else 0
     now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
     readme_display = str(root_readme.relative_to(root)) if root_readme else "NOT FOUND"
 
-    lines = [
+    yield from (
         "# 📋 MD Files Connector Report",
         f"\n_Generated: {now}_\n",
         "## 📊 Summary\n",
@@ -473,21 +646,33 @@ def generate_md_report(
         f"| ⚠️ Isolated (not in root README) | {len(isolated)} |",
         f"| 📊 README coverage | **{coverage:.1f}%** |",
         "",
-    ]
+    )
 
     if linked:
-        lines += _md_linked_section(root, linked)
+        yield from _md_linked_section(root, linked)
     if isolated:
-        lines += _md_isolated_section(root, isolated)
+        yield from _md_isolated_section(root, isolated)
     else:
-        lines.append("## 🎉 All MD files are linked in the root README!\n")
+        yield "## 🎉 All MD files are linked in the root README!\n"
+
+    yield "---"
+    yield "_Report generated by [MD Files Connector](https://github.com/Maneesh-Relanto/md-connector)_"
 
-    lines += [
-        "---",
-        "_Report generated by [MD Files Connector](https://github.com/Maneesh-Relanto/md-connector)_",
-    ]
 
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+def generate_md_report(
+    root: Path,
+    root_readme: Path | None,
+    all_md: list[MDFile],
+    linked: list[MDFile],
+    isolated: list[MDFile],
+    output_path: Path,
+):
+    # Stream lines to disk, newline-separated, instead of joining in memory
+    with output_path.open("w", encoding="utf-8") as fh:
+        sep = ""
+        for line in _md_report_lines(root, root_readme, all_md, linked, isolated):
+            fh.write(sep + line)
+            sep = "\n"
     return output_path
 
 
@@ -520,7 +705,7 @@ def write_github_summary(
     if isolated:
         lines.append("### ⚠️ Isolated Files\n")
         for md in isolated:
-            lines.append(f"- `{md.path.relative_to(root)}` — {md.title}")
+            lines.append(f"- `{_display_path(md, root)}` — {md.title}")
 
     with open(summary_file, "a") as fh:
         fh.write("\n".join(lines))
@@ -541,6 +726,17 @@ def _build_link_lines(isolated: list[MDFile], root_readme: Path) -> list[str]:
     return links
 
 
+def _parse_heading(line: str) -> tuple[int, str] | None:
+    """Return (level, text) for a level 1–3 ATX heading line, else None."""
+    if not line.startswith("#"):
+        return None
+    level = len(line) - len(line.lstrip("#"))
+    rest = line[level:]
+    if level > 3 or not rest[:1].isspace() or not rest.strip():
+        return None
+    return level, rest.strip()
+
+
 def fix_generic(root_readme: Path, isolated: list[MDFile]) -> int:
     """
     Append a '## 📎 Other Documentation' section to the root README with
@@ -549,11 +745,11 @@ def fix_generic(root_readme: Path, isolated: list[MDFile]) -> int:
     """
     content = root_readme.read_text(encoding="utf-8")
     link_lines = _build_link_lines(isolated, root_readme)
-    SECTION_HEADING = "## 📎 Other Documentation"
 
-    if SECTION_HEADING in content:
+    if OTHER_DOCS_HEADING in content:
         # Section exists — append only links not already present
-        new_links = [l for l in link_lines if l not in content]
+        existing = set(_LINK_ITEM_RE.findall(content))
+        new_links = [l for l in link_lines if l not in existing]
         if not new_links:
             return 0
         # Insert before the next ## heading after the section, or at EOF
@@ -561,7 +757,7 @@ def fix_generic(root_readme: Path, isolated: list[MDFile]) -> int:
         in_section = False
         insert_at = len(lines)
         for i, line in enumerate(lines):
-            if line.strip() == SECTION_HEADING:
+            if line.strip() == OTHER_DOCS_HEADING:
                 in_section = True
                 continue
             if in_section and line.startswith("## "):
@@ -571,7 +767,7 @@ def fix_generic(root_readme: Path, isolated: list[MDFile]) -> int:
         root_readme.write_text("".join(new_lines), encoding="utf-8")
         return len(new_links)
     else:
-        section = "\n\n" + SECTION_HEADING + "\n\n" + "\n".join(link_lines) + "\n"
+        section = "\n\n" + OTHER_DOCS_HEADING + "\n\n" + "\n".join(link_lines) + "\n"
         root_readme.write_text(content.rstrip() + section, encoding="utf-8")
         return len(link_lines)
 
@@ -592,11 +788,10 @@ def fix_docs(root_readme: Path, isolated: list[MDFile]) -> tuple[int, str]:
     section_title = ""
 
     for i, line in enumerate(lines):
-        m = _HEADING_RE.match(line)
-        if m and _DOCS_RE.search(m.group(2)):
+        heading = _parse_heading(line)
+        if heading and _DOCS_RE.search(heading[1]):
             section_start = i
-            section_level = len(m.group(1))
-            section_title = m.group(2).strip()
+            section_level, section_title = heading
             break
 
     if section_start is None:
@@ -606,14 +801,15 @@ def fix_docs(root_readme: Path, isolated: list[MDFile]) -> tuple[int, str]:
     # Find where the section ends (next heading at same or higher level, or EOF)
     section_end = len(lines)
     for i in range(section_start + 1, len(lines)):
-        m = _HEADING_RE.match(lines[i])
-        if m and len(m.group(1)) <= section_level:
+        heading = _parse_heading(lines[i])
+        if heading and heading[0] <= section_level:
             section_end = i
             break
 
     # Only add links not already mentioned in this section
     section_text = "".join(lines[section_start:section_end])
-    new_links = [l for l in link_lines if l not in section_text]
+    existing = set(_LINK_ITEM_RE.findall(section_text))
+    new_links = [l for l in link_lines if l not in existing]
     if not new_links:
         return 0, section_title
 
@@ -634,10 +830,10 @@ def fix_docs(root_readme: Path, isolated: list[MDFile]) -> tuple[int, str]:
 
 def _find_docs_heading(content: str) -> str | None:
     """Return the first heading text matching 'docs' or 'documentation', or None."""
-    for m in _HEADING_RE.finditer(content):
-        title = m.group(2).strip()
-        if _DOCS_RE.search(title):
-            return title
+    for line in content.splitlines():
+        heading = _parse_heading(line)
+        if heading and _DOCS_RE.search(heading[1]):
+            return heading[1]
     return None
 
 
@@ -658,8 +854,8 @@ def prompt_fix_menu(
     Show a colorful interactive menu and apply the chosen fix to root README.
     Only called when rich is available and terminal is interactive.
     """
-    from rich.console import Console as _Console
-    console = _Console()
+    _load_rich()
+    console = Console()
 
     content = root_readme.read_text(encoding="utf-8")
     found_docs_section = _find_docs_heading(content)
@@ -755,6 +951,10 @@ def main():
                         help="Skip generating the MD_REPORT.md file")
     parser.add_argument("--fail-on-isolated", action="store_true",
                         help="Exit with code 1 if any isolated MD files are found (useful in CI)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Do not read or write the {CACHE_FILENAME} parse cache")
+    parser.add_argument("--clean-cache", action="store_true",
+                        help="Discard the existing parse cache and rebuild it")
     args = parser.parse_args()
 
     root = Path(args.root).resolve()
@@ -767,43 +967,51 @@ def main():
     if not report_path.is_absolute():
         report_path = root / report_path
 
-    # 1. Scan & parse all MD files (exclude the generated report itself)
-    all_md = find_all_md_files(root, args.exclude, exclude_files={report_path})
+    # 1. Discover all MD files (exclude the generated report itself)
+    all_md = find_all_md_paths(root, args.exclude, exclude_files={report_path})
 
     # 2. Locate the root README (single source of truth)
-    all_readmes = find_all_readmes(all_md)
-    root_readme = next(
-        (rp for rp in all_readmes if rp.parent.resolve() == root.resolve()), None
-    )
+    root_readme = find_root_readme(all_md, root)
     if not root_readme:
         print("⚠️  No README.md found at project root — all MD files will be isolated.")
 
     # 3. Classify: strict root-README-only
     linked, isolated, _ = classify_files(all_md, root_readme, root)
 
-    # 4. Terminal dashboard
-    if RICH_AVAILABLE:
+    # 4. Parse content only for files that are displayed (not the root README),
+    #    reusing cached results for files unchanged since the last run
+    shown = linked + isolated
+    if args.no_cache:
+        hydrate_all(shown)
+    else:
+        cache_path = root / CACHE_FILENAME
+        cache = {} if args.clean_cache else load_parse_cache(cache_path)
+        hydrate_all(shown, cache)
+        live = {str(md.path) for md in shown}
+        save_parse_cache(cache_path, {k: v for k, v in cache.items() if k in live})
+
+    # 5. Terminal dashboard
+    if _load_rich():
         print_dashboard_rich(root, root_readme, all_md, linked, isolated)
     else:
         print_dashboard_plain(root, root_readme, all_md, linked, isolated)
 
-    # 5. MD Report
+    # 6. MD Report
     if not args.no_report:
         generate_md_report(root, root_readme, all_md, linked, isolated, report_path)
         print(f"📄 Report written to: {report_path}")
 
-    # 6. GitHub Actions summary (no-op outside CI)
+    # 7. GitHub Actions summary (no-op outside CI)
     write_github_summary(root, root_readme, all_md, linked, isolated)
 
-    # 7. Interactive fix menu — only in a real terminal, only when fixes needed
+    # 8. Interactive fix menu — only in a real terminal, only when fixes needed
     if RICH_AVAILABLE and isolated and root_readme and sys.stdin.isatty():
         prompt_fix_menu(root_readme, isolated)
 
-    # 8. Fail if requested and isolated files exist
+    # 9. Fail if requested and isolated files exist
     if args.fail_on_isolated and isolated:
         if RICH_AVAILABLE:
-            from rich.console import Console as _C
-            _C().print(
+            Console().print(
                 f"[bold red]\n✖ Failing: {len(isolated)} isolated file(s) found. "
                 "Fix them or remove --fail-on-isolated to suppress.[/bold red]"
             )
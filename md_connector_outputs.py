@@ -14,8 +14,9 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 from md_connector import (
-    find_all_md_files,
+    find_all_md_paths,
     find_all_readmes,
+    find_root_readme,
     classify_files,
 )
 
@@ -37,9 +38,10 @@ def main():
     if not report_path.is_absolute():
         report_path = root / report_path
 
-    all_md = find_all_md_files(root, args.exclude, exclude_files={report_path})
+    # Counts only — no need to read file contents
+    all_md = find_all_md_paths(root, args.exclude, exclude_files={report_path})
     all_readmes = find_all_readmes(all_md)
-    root_readme = next((rp for rp in all_readmes if rp.parent.resolve() == root.resolve()), None)
+    root_readme = find_root_readme(all_md, root)
 
     linked, isolated, _ = classify_files(all_md, root_readme, root)
 
@@ -2,75 +2,168 @@
 Tests for MD Files Connector core logic.
 """
 
+import time
 import pytest
 from pathlib import Path
 from md_connector import (
     parse_md_content,
     find_all_md_files,
+    find_all_md_paths,
+    hydrate,
+    load_parse_cache,
+    save_parse_cache,
     find_all_readmes,
+    find_root_readme,
     extract_md_references,
     classify_files,
+    generate_md_report,
     fix_generic,
     fix_docs,
     MDFile,
+    OTHER_DOCS_HEADING,
 )
 
-# Path to the bundled fixture project
-FIXTURE_ROOT = Path(__file__).parent / "fixtures" / "sample_project"
+# Path to the bundled fixture project (resolved once, at import)
+FIXTURE_ROOT = (Path(__file__).parent / "fixtures" / "sample_project").resolve()
 
 
 # ── parse_md_content ───────────────────────────────────────────────────────────
 
+# Read-only inputs for parse_md_content, written once per module (see md_corpus)
+_CORPUS = {
+    "h1_title.md": "# My Title\n\nSome description here.\n",
+    "description.md": "# Title\n\nThis is the first paragraph.\n",
+    "h2_sections.md": "# Title\n\n## Installation\n\n## Usage\n",
+    "five_words.md": "one two three four five",
+    "my-guide.md": "No heading here, just plain text.\n",
+    "code_block.md": "# Title\n\n```\n## Not A Section\n```\n\n## Real Section\n",
+    "long_description.md": "# Title\n\n" + "word " * 50 + "\n",   # > 160 chars
+}
+
+
+@pytest.fixture(scope="module")
+def md_corpus(tmp_path_factory):
+    """Directory holding every _CORPUS file, shared by the whole module."""
+    root = tmp_path_factory.mktemp("md_corpus")
+    for name, body in _CORPUS.items():
+        (root / name).write_text(body)
+    return root
+
+
 class TestParseMdContent:
-    def test_extracts_h1_title(self, tmp_path):
+    @pytest.mark.parametrize("name, check", [
+        pytest.param("h1_title.md", lambda r: r["title"] == "My Title",
+                     id="extracts_h1_title"),
+        pytest.param("description.md",
+                     lambda r: r["description"] == "This is the first paragraph.",
+                     id="extracts_description"),
+        pytest.param("h2_sections.md",
+                     lambda r: "Installation" in r["sections"] and "Usage" in r["sections"],
+                     id="extracts_h2_sections"),
+        pytest.param("five_words.md", lambda r: r["word_count"] == 5,
+                     id="counts_words"),
+        pytest.param("my-guide.md", lambda r: r["title"] == "My Guide",
+                     id="fallback_title_from_filename"),
+        pytest.param("code_block.md",
+                     lambda r: "Not A Section" not in r["sections"]
+                     and "Real Section" in r["sections"],
+                     id="skips_code_blocks"),
+        pytest.param("long_description.md", lambda r: len(r["description"]) <= 160,
+                     id="truncates_long_description"),
+        pytest.param("nonexistent.md",
+                     lambda r: r["title"] == "nonexistent" and r["word_count"] == 0,
+                     id="missing_file_returns_safe_defaults"),
+    ])
+    def test_parse_md_content(self, md_corpus, name, check):
+        result = parse_md_content(md_corpus / name)
+        assert check(result), result
+
+
+# ── parse cache ────────────────────────────────────────────────────────────────
+
+class TestParseCache:
+    def test_unchanged_file_is_served_from_cache(self, tmp_path):
         f = tmp_path / "doc.md"
-        f.write_text("# My Title\n\nSome description here.\n")
-        result = parse_md_content(f)
-        assert result["title"] == "My Title"
+        f.write_text("# Title\n")
+        cache: dict = {}
+        parse_md_content(f, cache)
+        cache[str(f)]["meta"]["title"] = "Cached"
 
-    def test_extracts_description(self, tmp_path):
-        f = tmp_path / "doc.md"
-        f.write_text("# Title\n\nThis is the first paragraph.\n")
-        result = parse_md_content(f)
-        assert result["description"] == "This is the first paragraph."
+        assert parse_md_content(f, cache)["title"] == "Cached"
 
-    def test_extracts_h2_sections(self, tmp_path):
+    def test_modified_file_is_reparsed(self, tmp_path):
         f = tmp_path / "doc.md"
-        f.write_text("# Title\n\n## Installation\n\n## Usage\n")
-        result = parse_md_content(f)
-        assert "Installation" in result["sections"]
-        assert "Usage" in result["sections"]
-
-    def test_counts_words(self, tmp_path):
+        f.write_text("# Old\n")
+        cache: dict = {}
+        parse_md_content(f, cache)
+        f.write_text("# Newer title\n")
+
+        assert parse_md_content(f, cache)["title"] == "Newer title"
+
+    @pytest.mark.parametrize("damage", [
+        pytest.param(lambda e: e.pop("meta"), id="missing_meta"),
+        pytest.param(lambda e: e.update(meta=["not", "a", "dict"]), id="non_dict_meta"),
+        pytest.param(lambda e: e["meta"].pop("sections"), id="missing_key"),
+    ])
+    def test_malformed_entry_is_reparsed(self, tmp_path, damage):
         f = tmp_path / "doc.md"
-        f.write_text("one two three four five")
-        result = parse_md_content(f)
-        assert result["word_count"] == 5
+        f.write_text("# Title\n\n## Usage\n")
+        cache: dict = {}
+        parse_md_content(f, cache)
+        damage(cache[str(f)])
 
-    def test_fallback_title_from_filename(self, tmp_path):
-        f = tmp_path / "my-guide.md"
-        f.write_text("No heading here, just plain text.\n")
-        result = parse_md_content(f)
-        assert result["title"] == "My Guide"
+        result = parse_md_content(f, cache)
+        assert result["title"] == "Title" and result["sections"] == ["Usage"]
 
-    def test_skips_code_blocks(self, tmp_path):
-        f = tmp_path / "doc.md"
-        f.write_text("# Title\n\n```\n## Not A Section\n```\n\n## Real Section\n")
-        result = parse_md_content(f)
-        assert "Not A Section" not in result["sections"]
-        assert "Real Section" in result["sections"]
+    def test_round_trip_and_corrupt_file(self, tmp_path):
+        cache_path = tmp_path / "cache.json"
+        save_parse_cache(cache_path, {"a": {"stamp": [1, 2], "meta": {}}})
+        assert load_parse_cache(cache_path) == {"a": {"stamp": [1, 2], "meta": {}}}
 
-    def test_truncates_long_description(self, tmp_path):
-        f = tmp_path / "doc.md"
-        long_para = "word " * 50  # > 160 chars
-        f.write_text(f"# Title\n\n{long_para}\n")
-        result = parse_md_content(f)
-        assert len(result["description"]) <= 160
+        cache_path.write_text("{not json")
+        assert load_parse_cache(cache_path) == {}
+        assert load_parse_cache(tmp_path / "missing.json") == {}
+
+
+# ── find_all_md_files ──────────────────────────────────────────────────────────
+
+class TestFindAllMdFiles:
+    def test_prunes_excluded_dirs(self, tmp_path):
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "README.md").write_text("# Pkg\n")
+        (tmp_path / "guide.md").write_text("# Guide\n")
+
+        all_md = find_all_md_files(tmp_path, ["node_modules"])
 
-    def test_missing_file_returns_safe_defaults(self, tmp_path):
-        result = parse_md_content(tmp_path / "nonexistent.md")
-        assert result["title"] == "nonexistent"
-        assert result["word_count"] == 0
+        assert [m.path.name for m in all_md] == ["guide.md"]
+
+    def test_results_are_sorted_and_skip_non_md(self, tmp_path):
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "b.md").write_text("# B\n")
+        (tmp_path / "a.md").write_text("# A\n")
+        (tmp_path / "notes.txt").write_text("not markdown\n")
+
+        all_md = find_all_md_files(tmp_path, [])
+
+        assert [m.path.relative_to(tmp_path).as_posix() for m in all_md] == ["a.md", "docs/b.md"]
+
+    def test_relpath_is_relative_to_root(self, tmp_path):
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "b.md").write_text("# B\n")
+
+        [md] = find_all_md_paths(tmp_path, [])
+
+        assert md.relpath == str(Path("docs") / "b.md")
+
+    def test_paths_only_discovery_defers_parsing(self, tmp_path):
+        (tmp_path / "guide.md").write_text("# Guide\n\nHow to use it.\n")
+
+        [md] = find_all_md_paths(tmp_path, [])
+        assert md.title == "" and md.word_count == 0
+
+        hydrate(md)
+        assert md.title == "Guide"
+        assert md.description == "How to use it."
 
 
 # ── extract_md_references ──────────────────────────────────────────────────────
@@ -99,6 +192,84 @@ class TestExtractMdReferences:
         refs = extract_md_references(readme, tmp_path)
         assert target.resolve() in refs
 
+    def test_finds_bare_path_and_badge_wrapped_link(self, tmp_path):
+        readme = tmp_path / "README.md"
+        bare = tmp_path / "NOTES.md"
+        badged = tmp_path / "STATUS.md"
+        bare.write_text("# Notes\n")
+        badged.write_text("# Status\n")
+        readme.write_text("[![ci](badge.svg)](STATUS.md) — see also NOTES.md\n")
+        refs = extract_md_references(readme, tmp_path)
+        assert bare.resolve() in refs
+        assert badged.resolve() in refs
+
+    def test_finds_paths_in_inline_code(self, tmp_path):
+        readme = tmp_path / "README.md"
+        paren = tmp_path / "CONTRIBUTING.md"
+        spaced = tmp_path / "docs" / "api.md"
+        spaced.parent.mkdir()
+        paren.write_text("# Contributing\n")
+        spaced.write_text("# API\n")
+        readme.write_text("See the guide (`CONTRIBUTING.md`). API: `docs/api.md`\n")
+        refs = extract_md_references(readme, tmp_path)
+        assert refs == {paren.resolve(), spaced.resolve()}
+
+    def test_finds_angle_bracket_link_and_path_in_link_text(self, tmp_path):
+        readme = tmp_path / "README.md"
+        angled = tmp_path / "GUIDE.md"
+        named = tmp_path / "docs" / "API.md"
+        named.parent.mkdir()
+        angled.write_text("# Guide\n")
+        named.write_text("# API\n")
+        readme.write_text(
+            "[Guide](<GUIDE.md>) and [docs/API.md](https://example.com/blob/main/docs/API.md)\n"
+        )
+        refs = extract_md_references(readme, tmp_path)
+        assert angled.resolve() in refs
+        assert named.resolve() in refs
+
+    def test_known_paths_match_without_filesystem(self, tmp_path):
+        readme = tmp_path / "README.md"
+        readme.write_text("See [Guide](./guide.md).\n")
+        known = {str(tmp_path / "guide.md")}   # never written to disk
+        refs = extract_md_references(readme, tmp_path, known)
+        assert refs == {tmp_path / "guide.md"}
+
+    def test_dotdot_through_missing_dir_agrees_with_and_without_known_paths(self, tmp_path):
+        root = tmp_path.resolve()
+        target = root / "b.md"
+        target.write_text("# B\n")
+        readme = root / "README.md"
+        readme.write_text("See [B](missing/../b.md).\n")
+        assert extract_md_references(readme, root) == {target}
+        assert extract_md_references(readme, root, {str(target)}) == {target}
+
+    def test_dotdot_after_symlinked_dir_follows_the_link(self, tmp_path):
+        root = tmp_path.resolve()
+        (root / "sub" / "inner").mkdir(parents=True)
+        try:
+            (root / "link").symlink_to(root / "sub" / "inner", target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported here")
+        (root / "b.md").write_text("# Top\n")
+        (root / "sub" / "b.md").write_text("# Sub\n")
+        readme = root / "README.md"
+        readme.write_text("See [B](link/../b.md).\n")
+        known = {str(root / "b.md"), str(root / "sub" / "b.md")}
+        refs = extract_md_references(readme, root, known)
+        assert refs == {root / "sub" / "b.md"}
+
+    @pytest.mark.slow
+    def test_long_path_like_run_does_not_backtrack(self, tmp_path):
+        # A linear scan takes milliseconds; a quadratic one takes close to a
+        # minute on this input, so the bound leaves room for loaded runners.
+        readme = tmp_path / "README.md"
+        readme.write_text("/" * 100_000 + "\n", encoding="utf-8")
+        start = time.perf_counter()
+        refs = extract_md_references(readme, tmp_path)
+        assert refs == set()
+        assert time.perf_counter() - start < 10.0
+
 
 # ── classify_files ─────────────────────────────────────────────────────────────
 
@@ -133,19 +304,41 @@ class TestClassifyFiles:
         assert any(m.path.name == "notes.md" for m in isolated)
 
 
+# ── find_root_readme ───────────────────────────────────────────────────────────
+
+class TestFindRootReadme:
+    def test_ignores_nested_readmes(self, tmp_path):
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "README.md").write_text("# Docs\n")
+        (tmp_path / "README.md").write_text("# Root\n")
+
+        all_md = find_all_md_paths(tmp_path, [])
+
+        assert find_root_readme(all_md, tmp_path) == tmp_path / "README.md"
+
+    def test_returns_none_without_root_readme(self, tmp_path):
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "README.md").write_text("# Docs\n")
+
+        assert find_root_readme(find_all_md_paths(tmp_path, []), tmp_path) is None
+
+
 # ── Fixture-based integration test ────────────────────────────────────────────
 
+@pytest.fixture(scope="module")
+def fixture_scan():
+    """Scan of the bundled (read-only) sample project, walked once per module."""
+    all_md = find_all_md_files(FIXTURE_ROOT, [".git"])
+    return all_md, find_all_readmes(all_md), find_root_readme(all_md, FIXTURE_ROOT)
+
+
 class TestFixtureProject:
-    def test_sample_project_coverage(self):
+    def test_sample_project_coverage(self, fixture_scan):
         """End-to-end scan of the bundled sample fixture project."""
-        all_md = find_all_md_files(FIXTURE_ROOT, [".git"])
-        all_readmes = find_all_readmes(all_md)
+        all_md, all_readmes, root_readme = fixture_scan
         assert len(all_readmes) >= 1, "Fixture must have at least one README"
+        assert root_readme is not None
 
-        root_readme = next(
-            (rp for rp in all_readmes if rp.parent.resolve() == FIXTURE_ROOT.resolve()),
-            None,
-        )
         linked, isolated, _ = classify_files(all_md, root_readme, FIXTURE_ROOT)
 
         # CONTRIBUTING.md is linked from fixture README
@@ -157,68 +350,68 @@ class TestFixtureProject:
         assert "API.md" in isolated_names
 
 
-# ── fix_generic ───────────────────────────────────────────────────────────────
-
-def _make_isolated(tmp_path: Path, filename: str, title: str) -> MDFile:
-    """Helper: create a real file and return an MDFile pointing at it."""
-    p = tmp_path / filename
-    p.write_text(f"# {title}\n", encoding="utf-8")
-    return MDFile(path=p, title=title)
-
+# ── generate_md_report ────────────────────────────────────────────────────────
 
-class TestFixGeneric:
-    def test_creates_new_section(self, tmp_path):
+class TestGenerateMdReport:
+    def test_hand_built_mdfiles_render_paths_relative_to_root(self, tmp_path):
         readme = tmp_path / "README.md"
-        readme.write_text("# My Project\n\nSome intro.\n", encoding="utf-8")
-        iso = _make_isolated(tmp_path, "guide.md", "Guide")
-
-        added = fix_generic(readme, [iso])
-
-        content = readme.read_text(encoding="utf-8")
-        assert added == 1
-        assert "## \U0001f4ce Other Documentation" in content
-        assert "- [Guide](guide.md)" in content
+        linked = [MDFile(path=tmp_path / "docs" / "guide.md", title="Guide")]
+        isolated = [MDFile(path=tmp_path / "notes.md", title="Notes")]
+        out = tmp_path / "MD_REPORT.md"
 
-    def test_returns_count_of_links_added(self, tmp_path):
-        readme = tmp_path / "README.md"
-        readme.write_text("# Project\n", encoding="utf-8")
-        files = [
-            _make_isolated(tmp_path, "a.md", "Alpha"),
-            _make_isolated(tmp_path, "b.md", "Beta"),
-            _make_isolated(tmp_path, "c.md", "Gamma"),
-        ]
+        generate_md_report(tmp_path, readme, [MDFile(path=readme)] + linked + isolated,
+                           linked, isolated, out)
 
-        added = fix_generic(readme, files)
+        report = out.read_text(encoding="utf-8")
+        assert f"`{Path('docs', 'guide.md')}`" in report
+        assert "`notes.md`" in report
+        assert "- [Notes](notes.md)" in report
 
-        assert added == 3
 
-    def test_appends_only_new_links_when_section_exists(self, tmp_path):
-        readme = tmp_path / "README.md"
-        readme.write_text(
-            "# Project\n\n## \U0001f4ce Other Documentation\n\n- [Alpha](a.md)\n",
-            encoding="utf-8",
-        )
-        _make_isolated(tmp_path, "a.md", "Alpha")  # already present
-        beta = _make_isolated(tmp_path, "b.md", "Beta")  # new
+# ── fix_generic ───────────────────────────────────────────────────────────────
 
-        added = fix_generic(readme, [MDFile(path=tmp_path / "a.md", title="Alpha"), beta])
+def _make_isolated(tmp_path: Path, filename: str, title: str) -> MDFile:
+    """Helper: an MDFile for an isolated file (fix_* only use its path, so none is written)."""
+    return MDFile(path=tmp_path / filename, title=title)
 
-        content = readme.read_text(encoding="utf-8")
-        assert added == 1
-        assert content.count("- [Alpha]") == 1   # no duplicate
-        assert "- [Beta](b.md)" in content
 
-    def test_returns_zero_when_all_links_already_present(self, tmp_path):
+class TestFixGeneric:
+    @pytest.mark.parametrize("body, specs, expected_added, check", [
+        pytest.param("# My Project\n\nSome intro.\n", [("guide.md", "Guide")], 1,
+                     lambda c: OTHER_DOCS_HEADING in c
+                     and "- [Guide](guide.md)" in c,
+                     id="creates_new_section"),
+        pytest.param("# Project\n", [("a.md", "Alpha"), ("b.md", "Beta"), ("c.md", "Gamma")], 3,
+                     lambda c: all(f"- [{t}]" in c for t in ("Alpha", "Beta", "Gamma")),
+                     id="returns_count_of_links_added"),
+        pytest.param("# Project\n\n" + OTHER_DOCS_HEADING + "\n\n- [Alpha](a.md)\n",
+                     [("a.md", "Alpha"), ("b.md", "Beta")], 1,
+                     lambda c: c.count("- [Alpha]") == 1 and "- [Beta](b.md)" in c,
+                     id="appends_only_new_links_when_section_exists"),
+        pytest.param("# Project\n\n" + OTHER_DOCS_HEADING + "\n\n- [Guide](guide.md)\n",
+                     [("guide.md", "Guide")], 0,
+                     lambda c: c.count("- [Guide]") == 1,
+                     id="returns_zero_when_all_links_already_present"),
+        pytest.param("# Project\n\n" + OTHER_DOCS_HEADING + "\n\n"
+                     "  - [Guide](guide.md) — how-to\n",
+                     [("guide.md", "Guide")], 0,
+                     lambda c: c.count("- [Guide]") == 1,
+                     id="existing_link_with_trailing_text_is_not_duplicated"),
+        pytest.param("# Project\n\n" + OTHER_DOCS_HEADING + "\n\n- [Notes](notes (draft).md)\n",
+                     [("notes (draft).md", "Notes")], 0,
+                     lambda c: c.count("- [Notes]") == 1,
+                     id="existing_link_with_parenthesised_target_is_not_duplicated"),
+    ])
+    def test_fix_generic(self, tmp_path, body, specs, expected_added, check):
         readme = tmp_path / "README.md"
-        readme.write_text(
-            "# Project\n\n## \U0001f4ce Other Documentation\n\n- [Guide](guide.md)\n",
-            encoding="utf-8",
-        )
-        iso = _make_isolated(tmp_path, "guide.md", "Guide")
+        readme.write_text(body, encoding="utf-8")
+        files = [_make_isolated(tmp_path, name, title) for name, title in specs]
 
-        added = fix_generic(readme, [iso])
+        added = fix_generic(readme, files)
 
-        assert added == 0
+        content = readme.read_text(encoding="utf-8")
+        assert added == expected_added
+        assert check(content), content
 
     def test_does_not_duplicate_section_heading(self, tmp_path):
         readme = tmp_path / "README.md"
@@ -228,82 +421,53 @@ class TestFixGeneric:
         fix_generic(readme, [iso])  # run twice
 
         content = readme.read_text(encoding="utf-8")
-        assert content.count("## \U0001f4ce Other Documentation") == 1
+        assert content.count(OTHER_DOCS_HEADING) == 1
 
 
 # ── fix_docs ──────────────────────────────────────────────────────────────────
 
 class TestFixDocs:
-    def test_finds_documentation_heading_and_appends(self, tmp_path):
-        readme = tmp_path / "README.md"
-        readme.write_text("# Project\n\n## Documentation\n\nSome text.\n", encoding="utf-8")
-        iso = _make_isolated(tmp_path, "api.md", "API Reference")
-
-        added, section = fix_docs(readme, [iso])
-
-        content = readme.read_text(encoding="utf-8")
-        assert added == 1
-        assert section == "Documentation"
-        assert "- [API Reference](api.md)" in content
-
-    def test_finds_docs_heading_variant(self, tmp_path):
-        readme = tmp_path / "README.md"
-        readme.write_text("# Project\n\n## Docs\n\nLinks go here.\n", encoding="utf-8")
-        iso = _make_isolated(tmp_path, "guide.md", "Guide")
-
-        added, section = fix_docs(readme, [iso])
-
-        assert added == 1
-        assert section == "Docs"
-
-    def test_returns_zero_and_empty_when_no_docs_section(self, tmp_path):
-        readme = tmp_path / "README.md"
-        readme.write_text("# Project\n\n## Installation\n\n## Usage\n", encoding="utf-8")
-        iso = _make_isolated(tmp_path, "notes.md", "Notes")
-
-        added, section = fix_docs(readme, [iso])
-
-        assert added == 0
-        assert section == ""
+    @pytest.mark.parametrize("body, specs, expected_added, expected_section, check", [
+        pytest.param("# Project\n\n## Documentation\n\nSome text.\n",
+                     [("api.md", "API Reference")], 1, "Documentation",
+                     lambda c: "- [API Reference](api.md)" in c,
+                     id="finds_documentation_heading_and_appends"),
+        pytest.param("# Project\n\n## Docs\n\nLinks go here.\n",
+                     [("guide.md", "Guide")], 1, "Docs",
+                     lambda c: "- [Guide](guide.md)" in c,
+                     id="finds_docs_heading_variant"),
         # README must be unmodified
-        assert "Notes" not in readme.read_text(encoding="utf-8")
-
-    def test_does_not_add_duplicate_links(self, tmp_path):
-        readme = tmp_path / "README.md"
-        readme.write_text(
-            "# Project\n\n## Documentation\n\n- [Guide](guide.md)\n",
-            encoding="utf-8",
-        )
-        iso = _make_isolated(tmp_path, "guide.md", "Guide")
-
-        added, _ = fix_docs(readme, [iso])
-
-        assert added == 0
-        assert readme.read_text(encoding="utf-8").count("- [Guide]") == 1
-
-    def test_does_not_match_docker_or_docstring(self, tmp_path):
-        readme = tmp_path / "README.md"
-        readme.write_text("# Project\n\n## Docker Setup\n\n## Docstring Guide\n", encoding="utf-8")
-        iso = _make_isolated(tmp_path, "x.md", "X")
-
-        added, section = fix_docs(readme, [iso])
-
-        assert added == 0
-        assert section == ""
-
-    def test_inserts_only_into_docs_section_not_after(self, tmp_path):
+        pytest.param("# Project\n\n## Installation\n\n## Usage\n",
+                     [("notes.md", "Notes")], 0, "",
+                     lambda c: "Notes" not in c,
+                     id="returns_zero_and_empty_when_no_docs_section"),
+        pytest.param("# Project\n\n## Documentation\n\n- [Guide](guide.md)\n",
+                     [("guide.md", "Guide")], 0, "Documentation",
+                     lambda c: c.count("- [Guide]") == 1,
+                     id="does_not_add_duplicate_links"),
+        pytest.param("# Project\n\n## Documentation\n\n- [Notes](notes (draft).md)\n",
+                     [("notes (draft).md", "Notes")], 0, "Documentation",
+                     lambda c: c.count("- [Notes]") == 1,
+                     id="does_not_duplicate_link_with_parenthesised_target"),
+        pytest.param("# Project\n\n## Docker Setup\n\n## Docstring Guide\n",
+                     [("x.md", "X")], 0, "",
+                     lambda c: "- [X]" not in c,
+                     id="does_not_match_docker_or_docstring"),
+        # Link must appear between the two headings
+        pytest.param("# Project\n\n## Documentation\n\n## Installation\n",
+                     [("guide.md", "Guide")], 1, "Documentation",
+                     lambda c: c.index("## Documentation") < c.index("- [Guide]")
+                     < c.index("## Installation"),
+                     id="inserts_only_into_docs_section_not_after"),
+    ])
+    def test_fix_docs(self, tmp_path, body, specs, expected_added, expected_section, check):
         readme = tmp_path / "README.md"
-        readme.write_text(
-            "# Project\n\n## Documentation\n\n## Installation\n",
-            encoding="utf-8",
-        )
-        iso = _make_isolated(tmp_path, "guide.md", "Guide")
+        readme.write_text(body, encoding="utf-8")
+        files = [_make_isolated(tmp_path, name, title) for name, title in specs]
 
-        fix_docs(readme, [iso])
+        added, section = fix_docs(readme, files)
 
         content = readme.read_text(encoding="utf-8")
-        doc_pos = content.index("## Documentation")
-        install_pos = content.index("## Installation")
-        link_pos = content.index("- [Guide]")
-        # Link must appear between the two headings
-        assert doc_pos < link_pos < install_pos
+        assert added == expected_added
+        assert section == expected_section
+        assert check(content), content